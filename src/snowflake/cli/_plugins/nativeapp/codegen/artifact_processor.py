@@ -37,7 +37,7 @@ class UnsupportedArtifactProcessorError(ClickException):
 
 def is_python_file_artifact(src: Path, _: Path):
     """Determines whether the provided source path is an existing Python file."""
-    return src.is_file() and src.suffix == ".py"
+    return src.suffix == ".py" and src.is_file()
 
 
 class ProjectFileContextManager:
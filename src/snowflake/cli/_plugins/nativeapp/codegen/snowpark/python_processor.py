@@ -16,10 +16,12 @@ from __future__ import annotations
 
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
 from textwrap import dedent
 from typing import Any, Dict, List, Optional, Set
 
+from jinja2 import Template, loaders
 from pydantic import ValidationError
 from snowflake.cli._plugins.nativeapp.artifacts import (
     find_setup_script_file,
@@ -55,7 +57,7 @@ from snowflake.cli.api.project.schemas.entities.common import (
     PathMapping,
     ProcessorMapping,
 )
-from snowflake.cli.api.rendering.jinja import jinja_render_from_file
+from snowflake.cli.api.rendering.jinja import get_basic_jinja_env
 
 DEFAULT_TIMEOUT = 30
 TEMPLATE_PATH = Path(__file__).parent / "callback_source.py.jinja"
@@ -112,16 +114,25 @@ def _determine_virtual_env(
 
 
 def _is_python_file_artifact(src: Path, dest: Path):
-    return src.is_file() and src.suffix == ".py"
+    return src.suffix == ".py" and src.is_file()
+
+
+@lru_cache()
+def _get_callback_source_template() -> Template:
+    """
+    Loads and compiles the sandbox callback template once; every Python file processed afterwards only renders it.
+    """
+    env = get_basic_jinja_env(
+        loader=loaders.FileSystemLoader(TEMPLATE_PATH.parent.as_posix())
+    )
+    return env.get_template(TEMPLATE_PATH.name)
 
 
 def _execute_in_sandbox(
     py_file: str, deploy_root: Path, kwargs: Dict[str, Any]
 ) -> Optional[List[Dict[str, Any]]]:
     # Create the code snippet to be executed in the sandbox
-    script_source = jinja_render_from_file(
-        template_path=TEMPLATE_PATH, data={"py_file": py_file}
-    )
+    script_source = _get_callback_source_template().render(py_file=py_file)
 
     try:
         completed_process = execute_script_in_sandbox(
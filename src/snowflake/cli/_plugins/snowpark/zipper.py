@@ -17,7 +17,7 @@ from __future__ import annotations
 import fnmatch
 import logging
 from pathlib import Path
-from typing import Dict, List, Literal
+from typing import List, Literal
 from zipfile import ZIP_DEFLATED, ZipFile
 
 from snowflake.cli.api.artifacts.bundle_map import BundleMap
@@ -74,14 +74,15 @@ def zip_dir(
     if isinstance(source, Path):
         source = [source]
 
-    files_to_pack: Dict[Path, List[Path]] = {
-        src: list(filter(_to_be_zipped, (f.absolute() for f in src.glob("**/*"))))
-        for src in source
-    }
-
+    # All sources are packed in a single pass over one open archive, so callers
+    # combining several directories never need to reopen it in append mode.
+    dest_zip_absolute = dest_zip.absolute()
     with ZipFile(dest_zip, mode, ZIP_DEFLATED, allowZip64=True) as package_zip:
-        for src, files in files_to_pack.items():
-            for file in files:
+        for src in source:
+            for file in src.glob("**/*"):
+                file = file.absolute()
+                if file == dest_zip_absolute or not _to_be_zipped(file):
+                    continue
                 log.debug("Adding %s to %s", file, dest_zip)
                 package_zip.write(file, arcname=file.relative_to(src))
 
@@ -110,9 +111,9 @@ def _path_without_top_level_directory(path: Path) -> str:
 
 
 def _to_be_zipped(file: Path) -> bool:
+    # This has to be a string because of fnmatch
+    file_as_str = str(file)
     for pattern in IGNORED_FILES:
-        # This has to be a string because of fnmatch
-        file_as_str = str(file)
         if file_as_str == pattern or fnmatch.fnmatch(file_as_str, pattern):
             return False
 
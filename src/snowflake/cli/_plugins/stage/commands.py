@@ -161,19 +161,21 @@ def stage_create(stage_name: FQN = StageNameArgument, **options) -> CommandResul
 @app.command("remove", requires_connection=True)
 def stage_remove(
     stage_name: FQN = StageNameArgument,
-    file_name: str = typer.Argument(
+    file_names: List[str] = typer.Argument(
         ...,
-        help="Name of the file to remove.",
+        help="Names of the files to remove.",
         show_default=False,
     ),
     **options,
 ) -> CommandResult:
     """
-    Removes a file from a stage.
+    Removes files from a stage.
     """
-
-    cursor = StageManager().remove(stage_name=stage_name.identifier, path=file_name)
-    return SingleQueryResult(cursor)
+    cursors = StageManager().remove_files(
+        stage_name=stage_name.identifier, paths=file_names
+    )
+    # Each cursor is moved to the next result, so rows are read before advancing it
+    return CollectionResult(row for c in cursors for row in QueryResult(c).result)
 
 
 @app.command("diff", hidden=True, requires_connection=True)
@@ -211,6 +213,11 @@ def execute(
     ),
     on_error: OnErrorType = OnErrorOption,
     variables: Optional[List[str]] = ExecuteVariablesOption,
+    parallel: int = typer.Option(
+        1,
+        help="Number of files to execute in parallel. By default files are executed one by one in alphabetical order. Requires `--on-error continue`, as files already running are not stopped when one of them fails. Files executed in parallel share the same session, so they should not change the session context, for example with `USE` statements.",
+        min=1,
+    ),
     **options,
 ):
     """
@@ -218,13 +225,16 @@ def execute(
     e.g. `@stage/*.sql`, `@stage/dev/*`. Only files with `.sql` extension will be executed.
     """
     results = StageManager().execute(
-        stage_path_str=stage_path, on_error=on_error, variables=variables
+        stage_path_str=stage_path,
+        on_error=on_error,
+        variables=variables,
+        parallel=parallel,
     )
     return CollectionResult(results)
 
 
 def get(recursive: bool, source_path: str, destination_path: str, parallel: int):
-    target = Path(destination_path).resolve()
+    target = Path(destination_path).absolute()
     if not recursive:
         cli_console.warning(
             "Use `--recursive` flag, which copy files recursively with directory structure. This will be the default behavior in the future."
@@ -237,10 +247,9 @@ def get(recursive: bool, source_path: str, destination_path: str, parallel: int)
     cursors = StageManager().get_recursive(
         stage_path=source_path, dest_path=target, parallel=parallel
     )
-    results = [list(QueryResult(c).result) for c in cursors]
-    flattened_results = list(itertools.chain.from_iterable(results))
+    results = (QueryResult(c).result for c in cursors)
     sorted_results = sorted(
-        flattened_results,
+        itertools.chain.from_iterable(results),
         key=lambda e: (path.dirname(e["file"]), path.basename(e["file"])),
     )
     return CollectionResult(sorted_results)
@@ -265,7 +274,7 @@ def _put(
         return CollectionResult(cursor_generator)
     else:
         cursor = StageManager().put(
-            local_path=source_path.resolve(),
+            local_path=source_path.absolute(),
             stage_path=destination_path,
             overwrite=overwrite,
             parallel=parallel,
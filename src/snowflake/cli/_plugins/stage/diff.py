@@ -15,6 +15,8 @@
 from __future__ import annotations
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path, PurePosixPath
 from typing import Collection, Dict, List, Optional, Tuple
@@ -33,6 +35,9 @@ log = logging.getLogger(__name__)
 
 StagePathType = PurePosixPath  # alias PurePosixPath as StagePath for clarity
 
+# above this many files to compare, local files are hashed in a thread pool
+_PARALLEL_HASHING_THRESHOLD = 32
+
 
 @dataclass
 class DiffResult:
@@ -74,14 +79,21 @@ def enumerate_files(path: Path) -> List[Path]:
     if not path.is_dir():
         raise ValueError("Path must point to a directory")
 
-    paths: List[Path] = []
-    for child in sorted(path.iterdir()):
-        if child.is_dir():
-            paths += enumerate_files(child)
-        else:
-            paths.append(child)
+    paths: List[str] = []
+    _enumerate_files(os.fspath(path), paths)
+    return [Path(p) for p in paths]
 
-    return paths
+
+def _enumerate_files(directory: str, paths: List[str]) -> None:
+    # os.scandir reuses the file type read along with the directory entries,
+    # so unlike Path.iterdir() + Path.is_dir() it does not stat every child
+    with os.scandir(directory) as it:
+        entries = sorted(it, key=lambda entry: os.path.normcase(entry.name))
+    for entry in entries:
+        if entry.is_dir():
+            _enumerate_files(entry.path, paths)
+        else:
+            paths.append(entry.path)
 
 
 def relative_to_stage_path(path: str, stage_path: StagePathParts) -> StagePathType:
@@ -141,6 +153,7 @@ def compute_stage_diff(local_root: Path, stage_path: StagePathParts) -> DiffResu
     remote_md5 = build_md5_map(remote_files, stage_path)
 
     result: DiffResult = DiffResult()
+    to_compare: List[Tuple[Path, StagePathType]] = []
 
     for local_file in local_files:
         relpath = local_file.relative_to(local_root)
@@ -149,26 +162,40 @@ def compute_stage_diff(local_root: Path, stage_path: StagePathParts) -> DiffResu
             # doesn't exist on the stage
             result.only_local.append(rel_stage_path)
         else:
-            # N.B. file size on stage is not always accurate, so cannot fail fast
-            try:
-                if file_matches_md5sum(local_file, remote_md5[rel_stage_path]):
-                    # We are assuming that we will not get accidental collisions here due to the
-                    # large space of the md5sum (32 * 4 = 128 bits means 1-in-9-trillion chance)
-                    # combined with the fact that the file name + path must also match elsewhere.
-                    result.identical.append(rel_stage_path)
-                else:
-                    # either the file has changed, or we can't tell if it has
-                    result.different.append(rel_stage_path)
-            except UnknownMD5FormatError:
-                log.warning(
-                    "Could not compare md5 for %s, assuming file has changed",
-                    local_file,
-                    exc_info=True,
-                )
-                result.different.append(rel_stage_path)
-
-            # mark this file as seen
-            del remote_md5[rel_stage_path]
+            to_compare.append((local_file, rel_stage_path))
+
+    def _matches(file_and_stage_path: Tuple[Path, StagePathType]) -> bool:
+        local_file, rel_stage_path = file_and_stage_path
+        # N.B. file size on stage is not always accurate, so cannot fail fast
+        try:
+            # We are assuming that we will not get accidental collisions here due to the
+            # large space of the md5sum (32 * 4 = 128 bits means 1-in-9-trillion chance)
+            # combined with the fact that the file name + path must also match elsewhere.
+            return file_matches_md5sum(local_file, remote_md5[rel_stage_path])
+        except UnknownMD5FormatError:
+            log.warning(
+                "Could not compare md5 for %s, assuming file has changed",
+                local_file,
+                exc_info=True,
+            )
+            return False
+
+    if len(to_compare) > _PARALLEL_HASHING_THRESHOLD:
+        # hashlib releases the GIL while hashing, so threads hash files concurrently
+        with ThreadPoolExecutor() as executor:
+            matches = list(executor.map(_matches, to_compare))
+    else:
+        matches = [_matches(file_and_stage_path) for file_and_stage_path in to_compare]
+
+    for (_, rel_stage_path), is_identical in zip(to_compare, matches):
+        if is_identical:
+            result.identical.append(rel_stage_path)
+        else:
+            # either the file has changed, or we can't tell if it has
+            result.different.append(rel_stage_path)
+
+        # mark this file as seen
+        del remote_md5[rel_stage_path]
 
     # every entry here is a file we never saw locally
     for rel_stage_path in remote_md5.keys():
@@ -23,7 +23,9 @@ import shutil
 import sys
 import time
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import nullcontext
+from contextvars import copy_context
 from dataclasses import dataclass
 from os import path
 from pathlib import Path
@@ -503,6 +505,20 @@ class StageManager(SqlExecutionMixin):
             stage_path = self.build_path(stage_name) / path
             return self.execute_query(f"remove {stage_path.path_for_sql()}")
 
+    def remove_files(
+        self, stage_name: str, paths: List[str], role: Optional[str] = None
+    ) -> Generator[SnowflakeCursor, None, None]:
+        """
+        This method will take file paths that exist on a Snowflake stage,
+        and remove them from the stage. All REMOVE statements are sent in a single request.
+        If provided with a role, then temporarily use this role to perform the operation above,
+        and switch back to the original role for the next commands to run.
+        """
+        with self.use_role(role) if role else nullcontext():
+            stage_root = self.build_path(stage_name)
+            queries = [f"remove {(stage_root / path).path_for_sql()}" for path in paths]
+            yield from self.execute_queries_in_single_request(queries)
+
     def create(
         self, fqn: FQN, comment: Optional[str] = None, temporary: bool = False
     ) -> SnowflakeCursor:
@@ -526,7 +542,14 @@ class StageManager(SqlExecutionMixin):
         on_error: OnErrorType,
         variables: Optional[List[str]] = None,
         requires_temporary_stage: bool = False,
+        parallel: int = 1,
     ):
+        if parallel > 1 and on_error == OnErrorType.BREAK:
+            # Files running concurrently cannot be stopped once one of them fails
+            raise UsageError(
+                "Parallel execution requires `--on-error continue`, as files that are already running cannot be stopped after a failure."
+            )
+
         if requires_temporary_stage:
             (
                 stage_path_parts,
@@ -563,14 +586,13 @@ class StageManager(SqlExecutionMixin):
         parsed_variables = parse_key_value_variables(variables)
         sql_variables = self._parse_execute_variables(parsed_variables)
         python_variables = self._parse_python_variables(parsed_variables)
-        results = []
 
         if any(file.endswith(".py") for file in sorted_file_path_list):
             self._python_exe_procedure = self._bootstrap_snowpark_execution_environment(
                 stage_path
             )
 
-        for file_path in sorted_file_path_list:
+        def _execute_file(file_path: str) -> Dict:
             file_stage_path = stage_path_parts.add_stage_prefix(file_path)
 
             # For better reporting push down the information about original
@@ -581,22 +603,38 @@ class StageManager(SqlExecutionMixin):
                 original_path = file_stage_path
 
             if file_path.endswith(".py"):
-                result = self._execute_python(
+                return self._execute_python(
                     file_stage_path=file_stage_path,
                     on_error=on_error,
                     variables=python_variables,
                     original_file=original_path,
                 )
-            else:
-                result = self._call_execute_immediate(
-                    file_stage_path=file_stage_path,
-                    variables=sql_variables,
-                    on_error=on_error,
-                    original_file=original_path,
-                )
-            results.append(result)
+            return self._call_execute_immediate(
+                file_stage_path=file_stage_path,
+                variables=sql_variables,
+                on_error=on_error,
+                original_file=original_path,
+            )
 
-        return results
+        if parallel <= 1:
+            return [
+                self._report_result(_execute_file(file_path))
+                for file_path in sorted_file_path_list
+            ]
+
+        # Files are independent of each other, so they can be executed concurrently.
+        # The connector allows sharing a connection between threads (threadsafety=2),
+        # so all files run in the current session. Results are reported from this
+        # thread, in alphabetical order.
+        executor = ThreadPoolExecutor(max_workers=parallel)
+        try:
+            futures = [
+                executor.submit(copy_context().run, _execute_file, file_path)
+                for file_path in sorted_file_path_list
+            ]
+            return [self._report_result(future.result()) for future in futures]
+        finally:
+            executor.shutdown(cancel_futures=True)
 
     def _create_temporary_copy_of_stage(
         self, stage_path: str
@@ -682,14 +720,17 @@ class StageManager(SqlExecutionMixin):
 
     @staticmethod
     def _success_result(file: str):
-        cli_console.warning(f"SUCCESS - {file}")
         return {"File": file, "Status": "SUCCESS", "Error": None}
 
     @staticmethod
     def _error_result(file: str, msg: str):
-        cli_console.warning(f"FAILURE - {file}")
         return {"File": file, "Status": "FAILURE", "Error": msg}
 
+    @staticmethod
+    def _report_result(result: Dict) -> Dict:
+        cli_console.warning(f"{result['Status']} - {result['File']}")
+        return result
+
     @staticmethod
     def _handle_execution_exception(on_error: OnErrorType, exception: Exception):
         if on_error == OnErrorType.BREAK:
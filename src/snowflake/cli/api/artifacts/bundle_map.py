@@ -182,9 +182,11 @@ class BundleMap:
             # file to the dest directory
             for root, subdirs, files in os.walk(absolute_src, followlinks=True):
                 relative_root = Path(root).relative_to(absolute_src)
+                src_root_for_output = src_for_output / relative_root
+                dest_root_for_output = dest_for_output / relative_root
                 for name in itertools.chain(subdirs, files):
-                    src_file_for_output = src_for_output / relative_root / name
-                    dest_file_for_output = dest_for_output / relative_root / name
+                    src_file_for_output = src_root_for_output / name
+                    dest_file_for_output = dest_root_for_output / name
                     if predicate(src_file_for_output, dest_file_for_output):
                         yield src_file_for_output, dest_file_for_output
 
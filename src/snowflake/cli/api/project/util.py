@@ -17,6 +17,7 @@ from __future__ import annotations
 import codecs
 import os
 import re
+from functools import lru_cache
 from typing import List, Optional
 from urllib.parse import quote
 
@@ -34,6 +35,18 @@ UNQUOTED_IDENTIFIER_REGEX = r"([a-zA-Z_])([a-zA-Z0-9_$]{0,254})"
 QUOTED_IDENTIFIER_REGEX = r'"((""|[^"]){0,255})"'
 VALID_IDENTIFIER_REGEX = f"(?:{UNQUOTED_IDENTIFIER_REGEX}|{QUOTED_IDENTIFIER_REGEX})"
 
+# identifier and literal checks run for every templated name and every stage path,
+# so the patterns are compiled once rather than looked up in the re cache on each call
+_UNQUOTED_IDENTIFIER_PATTERN = re.compile(UNQUOTED_IDENTIFIER_REGEX)
+_QUOTED_IDENTIFIER_PATTERN = re.compile(QUOTED_IDENTIFIER_REGEX)
+_VALID_IDENTIFIER_PATTERN = re.compile(VALID_IDENTIFIER_REGEX)
+_SINGLE_QUOTED_STRING_LITERAL_PATTERN = re.compile(SINGLE_QUOTED_STRING_LITERAL_REGEX)
+_NON_IDENTIFIER_CHAR_PATTERN = re.compile(r"[^a-zA-Z0-9_$]")
+_IDENTIFIER_START_CHAR_PATTERN = re.compile(r"[a-zA-Z_]")
+_DB_SCHEMA_AND_NAME_PATTERN = re.compile(DB_SCHEMA_AND_NAME)
+_SCHEMA_AND_NAME_PATTERN = re.compile(SCHEMA_AND_NAME)
+_UNESCAPED_SINGLE_QUOTE_PATTERN = re.compile(r"^'|(?<!')'")
+
 # An env var that is used to suffix the names of some account-level resources
 TEST_RESOURCE_SUFFIX_VAR = "SNOWFLAKE_CLI_TEST_RESOURCE_SUFFIX"
 
@@ -51,10 +64,10 @@ def sanitize_identifier(input_: str):
     If the identifier does not start with a letter or underscore, prefix it with an underscore.
     Limits the identifier to 255 characters.
     """
-    value = re.sub(r"[^a-zA-Z0-9_$]", "", f"{input_}")
+    value = _NON_IDENTIFIER_CHAR_PATTERN.sub("", f"{input_}")
 
     # if it does not start with a letter or underscore, prefix it with an underscore
-    if not value or not re.match(r"[a-zA-Z_]", value[0]):
+    if not value or not _IDENTIFIER_START_CHAR_PATTERN.match(value[0]):
         value = f"_{value}"
 
     # limit it to 255 characters
@@ -65,22 +78,30 @@ def is_valid_unquoted_identifier(identifier: str) -> bool:
     """
     Determines whether the provided identifier is a valid Snowflake unquoted identifier.
     """
-    return re.fullmatch(UNQUOTED_IDENTIFIER_REGEX, identifier) is not None
+    return _UNQUOTED_IDENTIFIER_PATTERN.fullmatch(identifier) is not None
 
 
 def is_valid_quoted_identifier(identifier: str) -> bool:
     """
     Determines whether the provided identifier is a valid Snowflake quoted identifier.
     """
-    return re.fullmatch(QUOTED_IDENTIFIER_REGEX, identifier) is not None
+    return _QUOTED_IDENTIFIER_PATTERN.fullmatch(identifier) is not None
 
 
 def is_valid_identifier(identifier: str) -> bool:
     """
     Determines whether the provided identifier is a valid Snowflake quoted or unquoted identifier.
     """
-    return is_valid_unquoted_identifier(identifier) or is_valid_quoted_identifier(
-        identifier
+    return _VALID_IDENTIFIER_PATTERN.fullmatch(identifier) is not None
+
+
+@lru_cache()
+def _object_name_pattern(max_depth: int, allow_quoted: bool) -> re.Pattern:
+    identifier_pattern = (
+        VALID_IDENTIFIER_REGEX if allow_quoted else UNQUOTED_IDENTIFIER_REGEX
+    )
+    return re.compile(
+        rf"{identifier_pattern}(?:\.{identifier_pattern}){{0,{max_depth}}}"
     )
 
 
@@ -92,11 +113,7 @@ def is_valid_object_name(name: str, max_depth=2, allow_quoted=True) -> bool:
     """
     if max_depth < 0:
         raise ValueError("max_depth must be non-negative")
-    identifier_pattern = (
-        VALID_IDENTIFIER_REGEX if allow_quoted else UNQUOTED_IDENTIFIER_REGEX
-    )
-    pattern = rf"{identifier_pattern}(?:\.{identifier_pattern}){{0,{max_depth}}}"
-    return re.fullmatch(pattern, name) is not None
+    return _object_name_pattern(max_depth, allow_quoted).fullmatch(name) is not None
 
 
 def to_quoted_identifier(input_value: str) -> str:
@@ -108,6 +125,10 @@ def to_quoted_identifier(input_value: str) -> str:
     if is_valid_quoted_identifier(input_value):
         return input_value
 
+    return _quote_identifier(input_value)
+
+
+def _quote_identifier(input_value: str) -> str:
     return '"' + input_value.replace('"', '""') + '"'
 
 
@@ -119,7 +140,8 @@ def to_identifier(name: str) -> str:
     if is_valid_identifier(name):
         return name
 
-    return to_quoted_identifier(name)
+    # already known not to be a valid quoted identifier, so quote it right away
+    return _quote_identifier(name)
 
 
 def identifier_to_str(identifier: str) -> str:
@@ -152,7 +174,7 @@ def unquote_identifier(identifier: str) -> str:
     # a quoted identifier
     identifier = to_identifier(identifier)
 
-    if match := re.fullmatch(QUOTED_IDENTIFIER_REGEX, identifier):
+    if match := _QUOTED_IDENTIFIER_PATTERN.fullmatch(identifier):
         return match.group(1).replace('""', '"')
     # unquoted identifiers are internally represented as uppercase
     return identifier.upper()
@@ -169,7 +191,7 @@ def is_valid_string_literal(literal: str) -> bool:
     """
     Determines if a literal is a valid single quoted string literal
     """
-    return re.fullmatch(SINGLE_QUOTED_STRING_LITERAL_REGEX, literal) is not None
+    return _SINGLE_QUOTED_STRING_LITERAL_PATTERN.fullmatch(literal) is not None
 
 
 def to_string_literal(raw_value: str) -> str:
@@ -180,7 +202,7 @@ def to_string_literal(raw_value: str) -> str:
     escaped = str(codecs.encode(raw_value, "unicode-escape"), "utf-8")
 
     # escape single quotes
-    escaped = re.sub(r"^'|(?<!')'", r"\'", escaped)
+    escaped = _UNESCAPED_SINGLE_QUOTE_PATTERN.sub(r"\'", escaped)
 
     return f"'{escaped}'"
 
@@ -191,9 +213,9 @@ def extract_schema(qualified_name: str):
     (i.e. schema.object or database.schema.object). If qualified_name is not
     qualified with a schema, returns None.
     """
-    if match := re.fullmatch(DB_SCHEMA_AND_NAME, qualified_name):
+    if match := _DB_SCHEMA_AND_NAME_PATTERN.fullmatch(qualified_name):
         return match.group(2)
-    elif match := re.fullmatch(SCHEMA_AND_NAME, qualified_name):
+    elif match := _SCHEMA_AND_NAME_PATTERN.fullmatch(qualified_name):
         return match.group(1)
     return None
 
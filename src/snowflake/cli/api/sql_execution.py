@@ -19,7 +19,7 @@ from contextlib import contextmanager
 from functools import cached_property
 from io import StringIO
 from textwrap import dedent
-from typing import Iterable, Optional, Tuple
+from typing import Generator, Iterable, List, Optional, Tuple
 
 from snowflake.cli.api.cli_global_context import get_cli_context
 from snowflake.cli.api.console import cli_console
@@ -94,6 +94,24 @@ class BaseSqlExecutor:
         """Executes multiple SQL queries (passed as one string) and returns the results as a list"""
         return list(self._execute_string(dedent(queries), **kwargs))
 
+    def execute_queries_in_single_request(
+        self, queries: List[str], **kwargs
+    ) -> Generator[SnowflakeCursor, None, None]:
+        """
+        Executes multiple SQL queries as one multi-statement request. The returned cursor is yielded
+        once per query, each time moved to the result of the next query.
+        """
+        if len(queries) == 1:
+            yield self.execute_query(queries[0], **kwargs)
+            return
+
+        self._log.debug("Executing %s", queries)
+        cursor = self._conn.cursor(**kwargs)
+        cursor.execute(";\n".join(queries), num_statements=len(queries))
+        yield cursor
+        while cursor.nextset():
+            yield cursor
+
 
 class SqlExecutor(BaseSqlExecutor):
     """
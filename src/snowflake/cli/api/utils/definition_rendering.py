@@ -15,9 +15,9 @@
 from __future__ import annotations
 
 import copy
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
-from jinja2 import Environment, TemplateSyntaxError, nodes
+from jinja2 import Environment, Template, TemplateSyntaxError, nodes
 from packaging.version import Version
 from snowflake.cli.api.cli_global_context import get_cli_context
 from snowflake.cli.api.console import cli_console as cc
@@ -47,24 +47,38 @@ class TemplatedEnvironment:
 
     def __init__(self, env: Environment):
         self._jinja_env: Environment = env
+        # Each value of the definition is parsed several times while rendering
+        # (metrics, dependency graph, final render), so parsed and compiled
+        # templates are kept for the lifetime of this environment.
+        self._parsed_templates: Dict[str, nodes.Template] = {}
+        self._compiled_templates: Dict[str, Template] = {}
 
     def render(self, template_value: Any, context: Context) -> Any:
         if not self.get_referenced_vars(template_value):
             return template_value
 
-        jinja_template = self._jinja_env.from_string(str(template_value))
-        return jinja_template.render(context)
+        template_str = str(template_value)
+        if template_str not in self._compiled_templates:
+            self._compiled_templates[template_str] = self._jinja_env.from_string(
+                template_str
+            )
+        return self._compiled_templates[template_str].render(context)
 
     def get_referenced_vars(self, template_value: Any) -> set[TemplateVar]:
         template_str = str(template_value)
-        try:
-            ast = self._jinja_env.parse(template_str)
-        except TemplateSyntaxError as e:
-            raise InvalidTemplate(
-                f"Error parsing template from project definition file. Value: '{template_str}'. Error: {e}"
-            ) from e
+        if template_str not in self._parsed_templates:
+            try:
+                self._parsed_templates[template_str] = self._jinja_env.parse(
+                    template_str
+                )
+            except TemplateSyntaxError as e:
+                raise InvalidTemplate(
+                    f"Error parsing template from project definition file. Value: '{template_str}'. Error: {e}"
+                ) from e
 
-        return self._get_referenced_vars(ast, template_str)
+        return self._get_referenced_vars(
+            self._parsed_templates[template_str], template_str
+        )
 
     def _get_referenced_vars(
         self,
@@ -36,8 +36,11 @@ def path_resolver(path_to_file: str) -> str:
     return path_to_file
 
 
+STAGE_PATH_PREFIXES = ("@", "snow://")
+
+
 def is_stage_path(path: str) -> bool:
-    return path.startswith("@") or path.startswith("snow://")
+    return path.startswith(STAGE_PATH_PREFIXES)
 
 
 def delete(path: Path) -> None:
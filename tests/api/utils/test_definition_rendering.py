@@ -14,6 +14,7 @@
 
 import os
 from textwrap import dedent
+from typing import Optional
 from unittest import mock
 
 import pytest
@@ -24,6 +25,36 @@ from snowflake.cli.api.utils.definition_rendering import render_definition_templ
 from snowflake.cli.api.utils.models import ProjectEnvironment
 from snowflake.cli.api.utils.templating_functions import get_templating_functions
 
+TEMPLATING_FUNCTIONS = get_templating_functions()
+EMPTY_PROJECT_ENVIRONMENT = ProjectEnvironment(default_env={}, override_env={})
+
+
+def expected_native_app(
+    name: str,
+    package_name: Optional[str] = None,
+    application: Optional[dict] = None,
+    **overrides,
+) -> dict:
+    """
+    Returns the native_app section rendered for USER=username, with default values
+    for all fields that are not overridden.
+    """
+    return {
+        "name": name,
+        "artifacts": [],
+        "bundle_root": "output/bundle/",
+        "deploy_root": "output/deploy/",
+        "generated_root": "__generated/",
+        "scratch_stage": "app_src.stage_snowflake_cli_scratch",
+        "source_stage": "app_src.stage",
+        "package": {
+            "name": package_name or f"{name}_pkg_username",
+            "distribution": "internal",
+        },
+        "application": application or {"name": f"{name}_username"},
+        **overrides,
+    }
+
 
 @mock.patch.dict(os.environ, {}, clear=True)
 def test_resolve_variables_in_project_no_cross_variable_dependencies():
@@ -39,7 +70,7 @@ def test_resolve_variables_in_project_no_cross_variable_dependencies():
     result = render_definition_template(definition, {}).project_context
 
     assert result == {
-        "fn": get_templating_functions(),
+        "fn": TEMPLATING_FUNCTIONS,
         "ctx": {
             "definition_version": "1.1",
             "env": ProjectEnvironment(
@@ -63,7 +94,7 @@ def test_resolve_variables_in_project_cross_variable_dependencies():
     result = render_definition_template(definition, {}).project_context
 
     assert result == {
-        "fn": get_templating_functions(),
+        "fn": TEMPLATING_FUNCTIONS,
         "ctx": {
             "definition_version": "1.1",
             "env": ProjectEnvironment(
@@ -100,7 +131,7 @@ def test_no_resolve_and_warning_in_version_1(warning_mock):
         "ctx": {
             "definition_version": "1",
             "native_app": {"name": "test_source_<% ctx.env.A %>", "artifacts": []},
-            "env": ProjectEnvironment(default_env={}, override_env={}),
+            "env": EMPTY_PROJECT_ENVIRONMENT,
         }
     }
     warning_mock.assert_called_once_with(
@@ -122,7 +153,7 @@ def test_partial_invalid_template_in_version_1(warning_mock):
         "ctx": {
             "definition_version": "1",
             "native_app": {"name": "test_source_<% ctx.env.A", "artifacts": []},
-            "env": ProjectEnvironment(default_env={}, override_env={}),
+            "env": EMPTY_PROJECT_ENVIRONMENT,
         }
     }
     # we still want to warn if there was an incorrect attempt to use templating
@@ -142,24 +173,11 @@ def test_no_warning_in_version_1_1(warning_mock):
     result = render_definition_template(definition, {}).project_context
 
     assert result == {
-        "fn": get_templating_functions(),
+        "fn": TEMPLATING_FUNCTIONS,
         "ctx": {
             "definition_version": "1.1",
-            "native_app": {
-                "name": "test_source_value",
-                "artifacts": [],
-                "bundle_root": "output/bundle/",
-                "deploy_root": "output/deploy/",
-                "generated_root": "__generated/",
-                "scratch_stage": "app_src.stage_snowflake_cli_scratch",
-                "source_stage": "app_src.stage",
-                "package": {
-                    "name": "test_source_value_pkg_username",
-                    "distribution": "internal",
-                },
-                "application": {"name": "test_source_value_username"},
-            },
-            "env": ProjectEnvironment(default_env={}, override_env={}),
+            "native_app": expected_native_app("test_source_value"),
+            "env": EMPTY_PROJECT_ENVIRONMENT,
         },
     }
     warning_mock.assert_not_called()
@@ -190,7 +208,7 @@ def test_resolve_variables_in_project_cross_project_dependencies():
     }
     result = render_definition_template(definition, {}).project_context
     assert result == {
-        "fn": get_templating_functions(),
+        "fn": TEMPLATING_FUNCTIONS,
         "ctx": {
             "definition_version": "1.1",
             "streamlit": {
@@ -228,7 +246,7 @@ def test_resolve_variables_in_project_environment_variables_precedence():
     result = render_definition_template(definition, {}).project_context
 
     assert result == {
-        "fn": get_templating_functions(),
+        "fn": TEMPLATING_FUNCTIONS,
         "ctx": {
             "definition_version": "1.1",
             "env": ProjectEnvironment(
@@ -262,25 +280,16 @@ def test_env_variables_do_not_get_resolved():
     }
     result = render_definition_template(definition, {}).project_context
     assert result == {
-        "fn": get_templating_functions(),
+        "fn": TEMPLATING_FUNCTIONS,
         "ctx": {
             "definition_version": "1.1",
-            "native_app": {
-                "name": "test_source_<% ctx.definition_version %>",
-                "artifacts": [],
-                "bundle_root": "output/bundle/",
-                "deploy_root": "output/deploy/",
-                "generated_root": "__generated/",
-                "scratch_stage": "app_src.stage_snowflake_cli_scratch",
-                "source_stage": "app_src.stage",
-                "package": {
-                    "name": '"test_source_<% ctx.definition_version %>_pkg_username"',
-                    "distribution": "internal",
-                },
-                "application": {
+            "native_app": expected_native_app(
+                "test_source_<% ctx.definition_version %>",
+                package_name='"test_source_<% ctx.definition_version %>_pkg_username"',
+                application={
                     "name": '"test_source_<% ctx.definition_version %>_username"'
                 },
-            },
+            ),
             "env": ProjectEnvironment(
                 default_env={
                     "reference_to_name": "test_source_<% ctx.definition_version %>",
@@ -328,6 +337,14 @@ def test_env_variables_do_not_get_resolved():
             },
         },
     ],
+    ids=[
+        "env_self_reference",
+        "env_two_variables",
+        "env_four_variables",
+        "env_and_native_app",
+        "native_app_self_reference",
+        "native_app_two_fields",
+    ],
 )
 def test_resolve_variables_error_on_cycle(definition):
     with pytest.raises(CycleDetectedError) as err:
@@ -389,23 +406,10 @@ def test_resolve_variables_blank_is_ok():
     result = render_definition_template(definition, {}).project_context
 
     assert result == {
-        "fn": get_templating_functions(),
+        "fn": TEMPLATING_FUNCTIONS,
         "ctx": {
             "definition_version": "1.1",
-            "native_app": {
-                "name": "",
-                "deploy_root": "",
-                "artifacts": [],
-                "bundle_root": "output/bundle/",
-                "generated_root": "__generated/",
-                "scratch_stage": "app_src.stage_snowflake_cli_scratch",
-                "source_stage": "app_src.stage",
-                "package": {
-                    "name": "_pkg_username",
-                    "distribution": "internal",
-                },
-                "application": {"name": "_username"},
-            },
+            "native_app": expected_native_app("", deploy_root=""),
             "env": ProjectEnvironment(
                 default_env={
                     "blank_default_env": "",
@@ -453,9 +457,8 @@ def test_resolve_variables_fails_if_referencing_unknown_variable(env, msg):
     assert msg == err.value.message
 
 
-@mock.patch.dict(os.environ, {}, clear=True)
-def test_unquoted_template_usage_in_strings_yaml(named_temporary_file):
-    text = """\
+UNQUOTED_TEMPLATES_YAML = dedent(
+    """\
     definition_version: "1.1"
     env:
         value: "Snowflake is great!"
@@ -468,10 +471,14 @@ def test_unquoted_template_usage_in_strings_yaml(named_temporary_file):
             this is multiline string 
             with template <% ctx.env.value %>
     """
+)
+
 
-    with named_temporary_file(suffix=".yml") as p:
-        p.write_text(dedent(text))
-        result = load_project([p])
+@mock.patch.dict(os.environ, {}, clear=True)
+def test_unquoted_template_usage_in_strings_yaml(tmp_path):
+    p = tmp_path / "snowflake.yml"
+    p.write_text(UNQUOTED_TEMPLATES_YAML)
+    result = load_project([p])
 
     assert result.project_context.get("ctx", {}).get("env", None) == ProjectEnvironment(
         default_env={
@@ -496,7 +503,7 @@ def test_injected_yml_in_env_should_not_be_expanded():
     result = render_definition_template(definition, {}).project_context
 
     assert result == {
-        "fn": get_templating_functions(),
+        "fn": TEMPLATING_FUNCTIONS,
         "ctx": {
             "definition_version": "1.1",
             "env": ProjectEnvironment(
@@ -534,130 +541,88 @@ def test_invalid_templating_syntax(template_value):
     assert err.value.message == f"Unexpected template syntax in {template_value}"
 
 
-def test_invalid_type_for_env_section():
-    definition = {
-        "definition_version": "1.1",
-        "env": ["test_env", "array_val1"],
-    }
-    with pytest.raises(SchemaValidationError) as err:
-        render_definition_template(definition, {})
-
-    assert "Input should be a valid dictionary" in err.value.message
-
-
-def test_invalid_type_for_env_variable():
+@pytest.mark.parametrize(
+    "env, expected_msg",
+    [
+        pytest.param(
+            ["test_env", "array_val1"],
+            "Input should be a valid dictionary",
+            id="env_section",
+        ),
+        pytest.param(
+            {"test_env": ["array_val1"]},
+            "Input should be a valid string",
+            id="env_variable",
+        ),
+    ],
+)
+def test_invalid_type_for_env(env, expected_msg):
     definition = {
         "definition_version": "1.1",
-        "env": {
-            "test_env": ["array_val1"],
-        },
+        "env": env,
     }
     with pytest.raises(SchemaValidationError) as err:
         render_definition_template(definition, {})
 
-    assert "Input should be a valid string" in err.value.message
-
-
-@mock.patch.dict(os.environ, {"env_var_test": "value_from_os_env"}, clear=True)
-def test_env_priority_from_cli_and_os_env_and_project_env():
-    definition = {
-        "definition_version": "1.1",
-        "env": {
-            "env_var_test": "value_from_definition_file",
-            "final_value": "<% ctx.env.env_var_test %>",
-        },
-    }
-    result = render_definition_template(
-        definition, {"ctx": {"env": {"env_var_test": "value_from_cli_override"}}}
-    ).project_context
-
-    assert result == {
-        "fn": get_templating_functions(),
-        "ctx": {
-            "definition_version": "1.1",
-            "env": ProjectEnvironment(
-                default_env={
-                    "env_var_test": "value_from_definition_file",
-                    "final_value": "value_from_cli_override",
-                },
-                override_env={"env_var_test": "value_from_cli_override"},
-            ),
-        },
-    }
-
-    assert result["ctx"]["env"]["env_var_test"] == "value_from_cli_override"
+    assert expected_msg in err.value.message
 
 
-@mock.patch.dict(os.environ, {}, clear=True)
-def test_values_env_from_only_overrides():
-    definition = {
-        "definition_version": "1.1",
-        "env": {
-            "final_value": "<% ctx.env.env_var_test %>",
-        },
-    }
-    result = render_definition_template(
-        definition, {"ctx": {"env": {"env_var_test": "value_from_cli_override"}}}
-    ).project_context
-
-    assert result == {
-        "fn": get_templating_functions(),
-        "ctx": {
-            "definition_version": "1.1",
-            "env": ProjectEnvironment(
-                default_env={"final_value": "value_from_cli_override"},
-                override_env={"env_var_test": "value_from_cli_override"},
-            ),
-        },
-    }
-
-    assert result["ctx"]["env"]["env_var_test"] == "value_from_cli_override"
-
-
-@mock.patch.dict(os.environ, {}, clear=True)
-def test_cli_env_var_blank():
-    definition = {
-        "definition_version": "1.1",
-    }
-    result = render_definition_template(
-        definition, {"ctx": {"env": {"env_var_test": ""}}}
-    ).project_context
-
-    assert result == {
-        "fn": get_templating_functions(),
-        "ctx": {
-            "definition_version": "1.1",
-            "env": ProjectEnvironment(
-                default_env={},
-                override_env={"env_var_test": ""},
-            ),
-        },
-    }
-
-    assert result["ctx"]["env"]["env_var_test"] == ""
-
-
-@mock.patch.dict(os.environ, {}, clear=True)
-def test_cli_env_var_does_not_expand_with_templating():
-    definition = {
-        "definition_version": "1.1",
-    }
-    result = render_definition_template(
-        definition, {"ctx": {"env": {"env_var_test": "<% ctx.env.something %>"}}}
-    ).project_context
+@pytest.mark.parametrize(
+    "os_env, definition_env, override_value, expected_default_env",
+    [
+        pytest.param(
+            {"env_var_test": "value_from_os_env"},
+            {
+                "env_var_test": "value_from_definition_file",
+                "final_value": "<% ctx.env.env_var_test %>",
+            },
+            "value_from_cli_override",
+            {
+                "env_var_test": "value_from_definition_file",
+                "final_value": "value_from_cli_override",
+            },
+            id="priority_from_cli_and_os_env_and_project_env",
+        ),
+        pytest.param(
+            {},
+            {"final_value": "<% ctx.env.env_var_test %>"},
+            "value_from_cli_override",
+            {"final_value": "value_from_cli_override"},
+            id="values_from_only_overrides",
+        ),
+        pytest.param({}, None, "", {}, id="cli_env_var_blank"),
+        pytest.param(
+            {},
+            None,
+            "<% ctx.env.something %>",
+            {},
+            id="cli_env_var_does_not_expand_with_templating",
+        ),
+    ],
+)
+def test_env_resolution_with_cli_overrides(
+    os_env, definition_env, override_value, expected_default_env
+):
+    definition = {"definition_version": "1.1"}
+    if definition_env is not None:
+        definition["env"] = definition_env
+    with mock.patch.dict(os.environ, os_env, clear=True):
+        result = render_definition_template(
+            definition, {"ctx": {"env": {"env_var_test": override_value}}}
+        ).project_context
 
     assert result == {
-        "fn": get_templating_functions(),
+        "fn": TEMPLATING_FUNCTIONS,
         "ctx": {
             "definition_version": "1.1",
             "env": ProjectEnvironment(
-                default_env={},
-                override_env={"env_var_test": "<% ctx.env.something %>"},
+                default_env=expected_default_env,
+                override_env={"env_var_test": override_value},
             ),
         },
     }
 
-    assert result["ctx"]["env"]["env_var_test"] == "<% ctx.env.something %>"
+    assert result["ctx"]["env"]["env_var_test"] == override_value
 
 
 @mock.patch.dict(os.environ, {"os_env_var": "os_env_var_value"}, clear=True)
@@ -697,27 +662,14 @@ def test_non_str_scalar_with_templates():
     result = render_definition_template(definition, {}).project_context
 
     assert result == {
-        "fn": get_templating_functions(),
+        "fn": TEMPLATING_FUNCTIONS,
         "ctx": {
             "definition_version": "1.1",
-            "native_app": {
-                "name": "test_app",
-                "artifacts": [],
-                "bundle_root": "output/bundle/",
-                "deploy_root": "output/deploy/",
-                "generated_root": "__generated/",
-                "scratch_stage": "app_src.stage_snowflake_cli_scratch",
-                "source_stage": "app_src.stage",
-                "package": {
-                    "name": "test_app_pkg_username",
-                    "distribution": "internal",
-                },
-                "application": {
-                    "name": "test_app_username",
-                    "debug": "truE",
-                },
-            },
-            "env": ProjectEnvironment(default_env={}, override_env={}),
+            "native_app": expected_native_app(
+                "test_app",
+                application={"name": "test_app_username", "debug": "truE"},
+            ),
+            "env": EMPTY_PROJECT_ENVIRONMENT,
         },
     }
 
@@ -739,27 +691,14 @@ def test_boolean_field_with_str_with_templates():
     result = render_definition_template(definition, {}).project_context
 
     assert result == {
-        "fn": get_templating_functions(),
+        "fn": TEMPLATING_FUNCTIONS,
         "ctx": {
             "definition_version": "1.1",
-            "native_app": {
-                "name": "test_app",
-                "artifacts": [],
-                "bundle_root": "output/bundle/",
-                "deploy_root": "output/deploy/",
-                "generated_root": "__generated/",
-                "scratch_stage": "app_src.stage_snowflake_cli_scratch",
-                "source_stage": "app_src.stage",
-                "package": {
-                    "name": "test_app_pkg_username",
-                    "distribution": "internal",
-                },
-                "application": {
-                    "name": "app_name_truE",
-                    "debug": "truE",
-                },
-            },
-            "env": ProjectEnvironment(default_env={}, override_env={}),
+            "native_app": expected_native_app(
+                "test_app",
+                application={"name": "app_name_truE", "debug": "truE"},
+            ),
+            "env": EMPTY_PROJECT_ENVIRONMENT,
         },
     }
 
@@ -795,26 +734,11 @@ def test_field_with_custom_validation_with_templates():
     result = render_definition_template(definition, {}).project_context
 
     assert result == {
-        "fn": get_templating_functions(),
+        "fn": TEMPLATING_FUNCTIONS,
         "ctx": {
             "definition_version": "1.1",
-            "native_app": {
-                "name": "test_app",
-                "artifacts": [],
-                "bundle_root": "output/bundle/",
-                "deploy_root": "output/deploy/",
-                "generated_root": "__generated/",
-                "scratch_stage": "app_src.stage_snowflake_cli_scratch",
-                "source_stage": "app_src.stage",
-                "package": {
-                    "name": "test_app_pkg_username",
-                    "distribution": "internal",
-                },
-                "application": {
-                    "name": "test_app_username",
-                },
-            },
-            "env": ProjectEnvironment(default_env={}, override_env={}),
+            "native_app": expected_native_app("test_app"),
+            "env": EMPTY_PROJECT_ENVIRONMENT,
         },
     }
 
@@ -81,34 +81,6 @@ def test_concat_ids_with_valid_values(input_list, expected_output):
     assert env.get("value") == expected_output
 
 
-def test_concat_ids_with_no_args():
-    definition = {
-        "definition_version": "1.1",
-        "env": {
-            "value": "<% fn.concat_ids() %>",
-        },
-    }
-
-    with pytest.raises(InvalidTemplate) as err:
-        render_definition_template(definition, {})
-
-    assert "concat_ids requires at least 1 argument(s)" in err.value.message
-
-
-def test_concat_ids_with_non_string_arg():
-    definition = {
-        "definition_version": "1.1",
-        "env": {
-            "value": "<% fn.concat_ids(123) %>",
-        },
-    }
-
-    with pytest.raises(InvalidTemplate) as err:
-        render_definition_template(definition, {})
-
-    assert "concat_ids only accepts String values" in err.value.message
-
-
 @pytest.mark.parametrize(
     "input_val, expected_output",
     [
@@ -140,48 +112,6 @@ def test_id_to_str_valid_values(input_val, expected_output):
     assert env.get("output_value") == expected_output
 
 
-def test_id_to_str_with_no_args():
-    definition = {
-        "definition_version": "1.1",
-        "env": {
-            "value": "<% fn.id_to_str() %>",
-        },
-    }
-
-    with pytest.raises(InvalidTemplate) as err:
-        render_definition_template(definition, {})
-
-    assert "id_to_str requires at least 1 argument(s)" in err.value.message
-
-
-def test_id_to_str_with_two_args():
-    definition = {
-        "definition_version": "1.1",
-        "env": {
-            "value": "<% fn.id_to_str('a', 'b') %>",
-        },
-    }
-
-    with pytest.raises(InvalidTemplate) as err:
-        render_definition_template(definition, {})
-
-    assert "id_to_str supports at most 1 argument(s)" in err.value.message
-
-
-def test_id_to_str_with_non_string_arg():
-    definition = {
-        "definition_version": "1.1",
-        "env": {
-            "value": "<% fn.id_to_str(123) %>",
-        },
-    }
-
-    with pytest.raises(InvalidTemplate) as err:
-        render_definition_template(definition, {})
-
-    assert "id_to_str only accepts String values" in err.value.message
-
-
 @pytest.mark.parametrize(
     "input_val, expected_output",
     [
@@ -213,48 +143,6 @@ def test_str_to_id_valid_values(input_val, expected_output):
     assert env.get("output_value") == expected_output
 
 
-def test_str_to_id_with_no_args():
-    definition = {
-        "definition_version": "1.1",
-        "env": {
-            "value": "<% fn.str_to_id() %>",
-        },
-    }
-
-    with pytest.raises(InvalidTemplate) as err:
-        render_definition_template(definition, {})
-
-    assert "str_to_id requires at least 1 argument(s)" in err.value.message
-
-
-def test_str_to_id_with_two_args():
-    definition = {
-        "definition_version": "1.1",
-        "env": {
-            "value": "<% fn.str_to_id('a', 'b') %>",
-        },
-    }
-
-    with pytest.raises(InvalidTemplate) as err:
-        render_definition_template(definition, {})
-
-    assert "str_to_id supports at most 1 argument(s)" in err.value.message
-
-
-def test_str_to_id_with_non_string_arg():
-    definition = {
-        "definition_version": "1.1",
-        "env": {
-            "value": "<% fn.str_to_id(123) %>",
-        },
-    }
-
-    with pytest.raises(InvalidTemplate) as err:
-        render_definition_template(definition, {})
-
-    assert "str_to_id only accepts String values" in err.value.message
-
-
 @pytest.mark.parametrize(
     "os_environ, expected_output",
     [
@@ -293,20 +181,6 @@ def test_get_username_with_fallback_value():
     assert env.get("output_value") == "fallback_user"
 
 
-def test_get_username_with_two_args_should_fail():
-    definition = {
-        "definition_version": "1.1",
-        "env": {
-            "value": "<% fn.get_username('a', 'b') %>",
-        },
-    }
-
-    with pytest.raises(InvalidTemplate) as err:
-        render_definition_template(definition, {})
-
-    assert "get_username supports at most 1 argument(s)" in err.value.message
-
-
 @pytest.mark.parametrize(
     "input_value, expected_output",
     [
@@ -335,29 +209,31 @@ def test_sanitize_id_valid_values(input_value, expected_output):
     assert env.get("output_value") == expected_output
 
 
-def test_sanitize_id_with_no_args():
-    definition = {
-        "definition_version": "1.1",
-        "env": {
-            "value": "<% fn.sanitize_id() %>",
-        },
-    }
-
-    with pytest.raises(InvalidTemplate) as err:
-        render_definition_template(definition, {})
-
-    assert "sanitize_id requires at least 1 argument(s)" in err.value.message
-
-
-def test_sanitize_id_with_two_args():
+@pytest.mark.parametrize(
+    "template, expected_msg",
+    [
+        ("fn.concat_ids()", "concat_ids requires at least 1 argument(s)"),
+        ("fn.concat_ids(123)", "concat_ids only accepts String values"),
+        ("fn.id_to_str()", "id_to_str requires at least 1 argument(s)"),
+        ("fn.id_to_str('a', 'b')", "id_to_str supports at most 1 argument(s)"),
+        ("fn.id_to_str(123)", "id_to_str only accepts String values"),
+        ("fn.str_to_id()", "str_to_id requires at least 1 argument(s)"),
+        ("fn.str_to_id('a', 'b')", "str_to_id supports at most 1 argument(s)"),
+        ("fn.str_to_id(123)", "str_to_id only accepts String values"),
+        ("fn.get_username('a', 'b')", "get_username supports at most 1 argument(s)"),
+        ("fn.sanitize_id()", "sanitize_id requires at least 1 argument(s)"),
+        ("fn.sanitize_id('a', 'b')", "sanitize_id supports at most 1 argument(s)"),
+    ],
+)
+def test_templating_functions_with_invalid_args(template, expected_msg):
     definition = {
         "definition_version": "1.1",
         "env": {
-            "value": "<% fn.sanitize_id('a', 'b') %>",
+            "value": f"<% {template} %>",
         },
     }
 
     with pytest.raises(InvalidTemplate) as err:
         render_definition_template(definition, {})
 
-    assert "sanitize_id supports at most 1 argument(s)" in err.value.message
+    assert expected_msg in err.value.message
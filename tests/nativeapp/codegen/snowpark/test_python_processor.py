@@ -396,15 +396,17 @@ def test_process_with_collected_functions(
 
     with temp_local_dir(minimal_dir_structure) as local_path:
         with pushd(local_path):
-            imports_variation = copy.deepcopy(native_app_extension_function_raw_data)
-            imports_variation["imports"] = [
-                "@dummy_stage_str",
-                "/",
-                "stagepath/extra_import1.zip",
-                "stagepath/some_dir_str",
-                "/stagepath/withslash.py",
-                "stagepath/data.py",
-            ]
+            imports_variation = {
+                **native_app_extension_function_raw_data,
+                "imports": [
+                    "@dummy_stage_str",
+                    "/",
+                    "stagepath/extra_import1.zip",
+                    "stagepath/some_dir_str",
+                    "/stagepath/withslash.py",
+                    "stagepath/data.py",
+                ],
+            }
             processor_mapping = ProcessorMapping(
                 name="snowpark",
                 properties={"env": {"type": "conda", "name": "snowpark-dev"}},
@@ -15,6 +15,7 @@ from __future__ import annotations
 
 import json
 import os
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
 from textwrap import dedent
@@ -109,6 +110,21 @@ def _get_wm(working_dir: Optional[str] = None):
     )
 
 
+def _mock_execute_with_role(mock_cursor, role: str, queries: list):
+    """
+    Same as mock_execute_helper, with the given queries wrapped in the switch to
+    the given role and back to the original one.
+    """
+    return mock_execute_helper(
+        [
+            (mock_cursor([("old_role",)], []), mock.call("select current_role()")),
+            (None, mock.call(f"use role {role}")),
+            *queries,
+            (None, mock.call("use role old_role")),
+        ]
+    )
+
+
 @mock.patch(SQL_FACADE_STAGE_EXISTS)
 @mock.patch(SQL_FACADE_CREATE_SCHEMA)
 @mock.patch(SQL_FACADE_CREATE_STAGE)
@@ -303,13 +319,10 @@ Use the --prune flag to delete them from the stage."""
 def test_get_app_pkg_distribution_in_snowflake(
     mock_execute, temp_dir, mock_cursor, workspace_context
 ):
-    side_effects, expected = mock_execute_helper(
+    side_effects, expected = _mock_execute_with_role(
+        mock_cursor,
+        "package_role",
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
-            (None, mock.call("use role package_role")),
             (
                 mock_cursor(
                     [
@@ -321,8 +334,7 @@ def test_get_app_pkg_distribution_in_snowflake(
                 ),
                 mock.call("describe application package app_pkg"),
             ),
-            (None, mock.call("use role old_role")),
-        ]
+        ],
     )
     mock_execute.side_effect = side_effects
 
@@ -342,95 +354,46 @@ def test_get_app_pkg_distribution_in_snowflake(
 
 
 @mock.patch(SQL_EXECUTOR_EXECUTE)
-def test_get_app_pkg_distribution_in_snowflake_throws_programming_error(
-    mock_execute, temp_dir, mock_cursor, workspace_context
-):
-    side_effects, expected = mock_execute_helper(
-        [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
-            (None, mock.call("use role package_role")),
-            (
-                DoesNotExistOrUnauthorizedError(
-                    msg="Application package app_pkg does not exist or not authorized.",
-                ),
-                mock.call("describe application package app_pkg"),
+@pytest.mark.parametrize(
+    "describe_result, expected_error, expected_message",
+    [
+        pytest.param(
+            DoesNotExistOrUnauthorizedError(
+                msg="Application package app_pkg does not exist or not authorized.",
             ),
-            (None, mock.call("use role old_role")),
-        ]
-    )
-    mock_execute.side_effect = side_effects
-
-    current_working_directory = os.getcwd()
-    create_named_file(
-        file_name="snowflake.yml",
-        dir_name=current_working_directory,
-        contents=[mock_snowflake_yml_file_v2],
-    )
-
-    dm = _get_dm()
-    pkg_model: ApplicationPackageEntityModel = dm.project_definition.entities["app_pkg"]
-    pkg = ApplicationPackageEntity(pkg_model, workspace_context)
-
-    with pytest.raises(DoesNotExistOrUnauthorizedError):
-        pkg.get_app_pkg_distribution_in_snowflake()
-
-    assert mock_execute.mock_calls == expected
-
-
-@mock.patch(SQL_EXECUTOR_EXECUTE)
-def test_get_app_pkg_distribution_in_snowflake_throws_execution_error(
-    mock_execute, temp_dir, mock_cursor, workspace_context
-):
-    side_effects, expected = mock_execute_helper(
-        [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
+            DoesNotExistOrUnauthorizedError,
+            None,
+            id="programming_error",
+        ),
+        pytest.param([], SnowflakeSQLExecutionError, None, id="execution_error"),
+        pytest.param(
+            [("name", "app_pkg"), ["owner", "package_role"]],
+            ObjectPropertyNotFoundError,
+            dedent(
+                f"""\
+                Could not find the 'distribution' attribute for application package app_pkg in the output of SQL query:
+                'describe application package app_pkg'
+                """
             ),
-            (None, mock.call("use role package_role")),
-            (mock_cursor([], []), mock.call("describe application package app_pkg")),
-            (None, mock.call("use role old_role")),
-        ]
-    )
-    mock_execute.side_effect = side_effects
-
-    current_working_directory = os.getcwd()
-    create_named_file(
-        file_name="snowflake.yml",
-        dir_name=current_working_directory,
-        contents=[mock_snowflake_yml_file_v2],
-    )
-
-    dm = _get_dm()
-    pkg_model: ApplicationPackageEntityModel = dm.project_definition.entities["app_pkg"]
-    pkg = ApplicationPackageEntity(pkg_model, workspace_context)
-
-    with pytest.raises(SnowflakeSQLExecutionError):
-        pkg.get_app_pkg_distribution_in_snowflake()
-
-    assert mock_execute.mock_calls == expected
-
-
-@mock.patch(SQL_EXECUTOR_EXECUTE)
-def test_get_app_pkg_distribution_in_snowflake_throws_distribution_error(
-    mock_execute, temp_dir, mock_cursor, workspace_context
+            id="distribution_error",
+        ),
+    ],
+)
+def test_get_app_pkg_distribution_in_snowflake_throws_error(
+    mock_execute,
+    describe_result,
+    expected_error,
+    expected_message,
+    temp_dir,
+    mock_cursor,
+    workspace_context,
 ):
-    side_effects, expected = mock_execute_helper(
-        [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
-            (None, mock.call("use role package_role")),
-            (
-                mock_cursor([("name", "app_pkg"), ["owner", "package_role"]], []),
-                mock.call("describe application package app_pkg"),
-            ),
-            (None, mock.call("use role old_role")),
-        ]
+    if not isinstance(describe_result, Exception):
+        describe_result = mock_cursor(describe_result, [])
+    side_effects, expected = _mock_execute_with_role(
+        mock_cursor,
+        "package_role",
+        [(describe_result, mock.call("describe application package app_pkg"))],
     )
     mock_execute.side_effect = side_effects
 
@@ -445,18 +408,10 @@ def test_get_app_pkg_distribution_in_snowflake_throws_distribution_error(
     pkg_model: ApplicationPackageEntityModel = dm.project_definition.entities["app_pkg"]
     pkg = ApplicationPackageEntity(pkg_model, workspace_context)
 
-    with pytest.raises(ObjectPropertyNotFoundError) as err:
+    with pytest.raises(expected_error, match=expected_message):
         pkg.get_app_pkg_distribution_in_snowflake()
 
     assert mock_execute.mock_calls == expected
-    assert err.match(
-        dedent(
-            f"""\
-        Could not find the 'distribution' attribute for application package app_pkg in the output of SQL query:
-        'describe application package app_pkg'
-        """
-        )
-    )
 
 
 @mock_get_app_pkg_distribution_in_sf()
@@ -553,13 +508,10 @@ def test_is_app_pkg_distribution_same_in_sf_has_mismatch(
 def test_get_existing_app_info_app_exists(
     mock_execute, temp_dir, mock_cursor, workspace_context
 ):
-    side_effects, expected = mock_execute_helper(
+    side_effects, expected = _mock_execute_with_role(
+        mock_cursor,
+        "app_role",
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
-            (None, mock.call("use role app_role")),
             (
                 mock_cursor(
                     [
@@ -574,8 +526,7 @@ def test_get_existing_app_info_app_exists(
                 ),
                 mock.call("show applications like 'MYAPP'", cursor_class=DictCursor),
             ),
-            (None, mock.call("use role old_role")),
-        ]
+        ],
     )
     mock_execute.side_effect = side_effects
 
@@ -599,19 +550,15 @@ def test_get_existing_app_info_app_exists(
 def test_get_existing_app_info_app_does_not_exist(
     mock_execute, temp_dir, mock_cursor, workspace_context
 ):
-    side_effects, expected = mock_execute_helper(
+    side_effects, expected = _mock_execute_with_role(
+        mock_cursor,
+        "app_role",
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
-            (None, mock.call("use role app_role")),
             (
                 mock_cursor([], []),
                 mock.call("show applications like 'MYAPP'", cursor_class=DictCursor),
             ),
-            (None, mock.call("use role old_role")),
-        ]
+        ],
     )
     mock_execute.side_effect = side_effects
 
@@ -634,13 +581,10 @@ def test_get_existing_app_info_app_does_not_exist(
 def test_get_existing_app_pkg_info_app_pkg_exists(
     mock_execute, temp_dir, mock_cursor, workspace_context
 ):
-    side_effects, expected = mock_execute_helper(
+    side_effects, expected = _mock_execute_with_role(
+        mock_cursor,
+        "package_role",
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
-            (None, mock.call("use role package_role")),
             (
                 mock_cursor(
                     [
@@ -658,8 +602,7 @@ def test_get_existing_app_pkg_info_app_pkg_exists(
                     cursor_class=DictCursor,
                 ),
             ),
-            (None, mock.call("use role old_role")),
-        ]
+        ],
     )
     mock_execute.side_effect = side_effects
 
@@ -683,13 +626,10 @@ def test_get_existing_app_pkg_info_app_pkg_exists(
 def test_get_existing_app_pkg_info_app_pkg_does_not_exist(
     mock_execute, temp_dir, mock_cursor, workspace_context
 ):
-    side_effects, expected = mock_execute_helper(
+    side_effects, expected = _mock_execute_with_role(
+        mock_cursor,
+        "package_role",
         [
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
-            (None, mock.call("use role package_role")),
             (
                 mock_cursor([], []),
                 mock.call(
@@ -697,8 +637,7 @@ def test_get_existing_app_pkg_info_app_pkg_does_not_exist(
                     cursor_class=DictCursor,
                 ),
             ),
-            (None, mock.call("use role old_role")),
-        ]
+        ],
     )
     mock_execute.side_effect = side_effects
 
@@ -974,123 +913,45 @@ def test_create_app_pkg_different_owner(
     mock_execute.assert_not_called()
 
 
-# Test create_app_package() with distribution external AND variable mismatch
-@mock.patch(APP_PACKAGE_ENTITY_GET_EXISTING_APP_PKG_INFO)
-@mock_get_app_pkg_distribution_in_sf()
-@mock.patch(APP_PACKAGE_ENTITY_IS_DISTRIBUTION_SAME)
-@pytest.mark.parametrize(
-    "is_pkg_distribution_same",
-    [False, True],
-)
-@mock.patch(SQL_FACADE_GET_UI_PARAMETER, return_value="ENABLED")
-def test_create_app_pkg_external_distribution(
-    mock_get_ui_parameter,
-    mock_is_distribution_same,
-    mock_get_distribution,
-    mock_get_existing_app_pkg_info,
-    is_pkg_distribution_same,
-    temp_dir,
-    workspace_context,
-):
-    mock_is_distribution_same.return_value = is_pkg_distribution_same
-    mock_get_distribution.return_value = "external"
-    mock_get_existing_app_pkg_info.return_value = {
-        "name": "APP_PKG",
-        "comment": "random",
-        "version": LOOSE_FILES_MAGIC_VERSION,
-        "owner": "PACKAGE_ROLE",
-    }
-
-    current_working_directory = os.getcwd()
-    create_named_file(
-        file_name="snowflake.yml",
-        dir_name=current_working_directory,
-        contents=[mock_snowflake_yml_file_v2],
-    )
-
-    dm = _get_dm()
-    pkg_model: ApplicationPackageEntityModel = dm.project_definition.entities["app_pkg"]
-    pkg = ApplicationPackageEntity(pkg_model, workspace_context)
-    workspace_context.console = mock.MagicMock()
-    pkg.create_app_package()
-    if not is_pkg_distribution_same:
-        workspace_context.console.warning.assert_called_once_with(
-            "Continuing to execute `snow app run` on application package app_pkg with distribution 'external'."
-        )
-
-
-# Test create_app_package() with distribution internal AND variable mismatch AND special comment is True
+# Test create_app_package() with a distribution mismatch, for packages that can and can't be reused
 @mock.patch(APP_PACKAGE_ENTITY_GET_EXISTING_APP_PKG_INFO)
 @mock_get_app_pkg_distribution_in_sf()
 @mock.patch(APP_PACKAGE_ENTITY_IS_DISTRIBUTION_SAME)
+@pytest.mark.parametrize("is_pkg_distribution_same", [False, True])
 @pytest.mark.parametrize(
-    "is_pkg_distribution_same, special_comment",
+    "distribution, comment, expected_error",
     [
-        (False, SPECIAL_COMMENT),
-        (False, SPECIAL_COMMENT_OLD),
-        (True, SPECIAL_COMMENT),
-        (True, SPECIAL_COMMENT_OLD),
+        pytest.param("external", "random", None, id="external"),
+        pytest.param("internal", SPECIAL_COMMENT, None, id="internal_special_comment"),
+        pytest.param(
+            "internal", SPECIAL_COMMENT_OLD, None, id="internal_special_comment_old"
+        ),
+        pytest.param(
+            "internal",
+            "dummy",
+            ApplicationPackageAlreadyExistsError,
+            id="internal_no_special_comment",
+        ),
     ],
 )
 @mock.patch(SQL_FACADE_GET_UI_PARAMETER, return_value="ENABLED")
-def test_create_app_pkg_internal_distribution_special_comment(
+def test_create_app_pkg_distribution(
     mock_get_ui_parameter,
     mock_is_distribution_same,
     mock_get_distribution,
     mock_get_existing_app_pkg_info,
-    is_pkg_distribution_same,
-    special_comment,
-    temp_dir,
-    workspace_context,
-):
-    mock_is_distribution_same.return_value = is_pkg_distribution_same
-    mock_get_distribution.return_value = "internal"
-    mock_get_existing_app_pkg_info.return_value = {
-        "name": "APP_PKG",
-        "comment": special_comment,
-        "version": LOOSE_FILES_MAGIC_VERSION,
-        "owner": "PACKAGE_ROLE",
-    }
-
-    current_working_directory = os.getcwd()
-    create_named_file(
-        file_name="snowflake.yml",
-        dir_name=current_working_directory,
-        contents=[mock_snowflake_yml_file_v2],
-    )
-
-    dm = _get_dm()
-    pkg_model: ApplicationPackageEntityModel = dm.project_definition.entities["app_pkg"]
-    pkg = ApplicationPackageEntity(pkg_model, workspace_context)
-    workspace_context.console = mock.MagicMock()
-    pkg.create_app_package()
-    if not is_pkg_distribution_same:
-        workspace_context.console.warning.assert_called_once_with(
-            "Continuing to execute `snow app run` on application package app_pkg with distribution 'internal'."
-        )
-
-
-# Test create_app_package() with distribution internal AND variable mismatch AND special comment is False
-@mock.patch(APP_PACKAGE_ENTITY_GET_EXISTING_APP_PKG_INFO)
-@mock_get_app_pkg_distribution_in_sf()
-@mock.patch(APP_PACKAGE_ENTITY_IS_DISTRIBUTION_SAME)
-@pytest.mark.parametrize(
-    "is_pkg_distribution_same",
-    [False, True],
-)
-def test_create_app_pkg_internal_distribution_no_special_comment(
-    mock_is_distribution_same,
-    mock_get_distribution,
-    mock_get_existing_app_pkg_info,
+    distribution,
+    comment,
+    expected_error,
     is_pkg_distribution_same,
     temp_dir,
     workspace_context,
 ):
     mock_is_distribution_same.return_value = is_pkg_distribution_same
-    mock_get_distribution.return_value = "internal"
+    mock_get_distribution.return_value = distribution
     mock_get_existing_app_pkg_info.return_value = {
         "name": "APP_PKG",
-        "comment": "dummy",
+        "comment": comment,
         "version": LOOSE_FILES_MAGIC_VERSION,
         "owner": "PACKAGE_ROLE",
     }
@@ -1106,12 +967,12 @@ def test_create_app_pkg_internal_distribution_no_special_comment(
     pkg_model: ApplicationPackageEntityModel = dm.project_definition.entities["app_pkg"]
     pkg = ApplicationPackageEntity(pkg_model, workspace_context)
     workspace_context.console = mock.MagicMock()
-    with pytest.raises(ApplicationPackageAlreadyExistsError):
+    with pytest.raises(expected_error) if expected_error else nullcontext():
         pkg.create_app_package()
 
     if not is_pkg_distribution_same:
         workspace_context.console.warning.assert_called_once_with(
-            "Continuing to execute `snow app run` on application package app_pkg with distribution 'internal'."
+            f"Continuing to execute `snow app run` on application package app_pkg with distribution '{distribution}'."
         )
 
 
@@ -1404,27 +1265,24 @@ def test_validate_use_scratch_stage(mock_execute, mock_deploy, temp_dir, mock_cu
     )
 
     success_data = dict(status="SUCCESS")
-    side_effects, expected = mock_execute_helper(
+    side_effects, expected = _mock_execute_with_role(
+        mock_cursor,
+        "package_role",
         [
-            (
-                mock_cursor([[json.dumps(success_data)]], []),
-                mock.call(
-                    "call system$validate_native_app_setup('@app_pkg.app_src.stage_snowflake_cli_scratch')"
-                ),
-            ),
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
-            (None, mock.call("use role package_role")),
             (
                 mock_cursor([], []),
                 mock.call(
-                    f"drop stage if exists app_pkg.app_src.stage_snowflake_cli_scratch"
+                    "drop stage if exists app_pkg.app_src.stage_snowflake_cli_scratch"
                 ),
             ),
-            (None, mock.call("use role old_role")),
-        ]
+        ],
+    )
+    side_effects.insert(0, mock_cursor([[json.dumps(success_data)]], []))
+    expected.insert(
+        0,
+        mock.call(
+            "call system$validate_native_app_setup('@app_pkg.app_src.stage_snowflake_cli_scratch')"
+        ),
     )
     mock_execute.side_effect = side_effects
 
@@ -1479,27 +1337,24 @@ def test_validate_failing_drops_scratch_stage(
         column=-1,
     )
     failure_data = dict(status="FAIL", errors=[error], warnings=[])
-    side_effects, expected = mock_execute_helper(
+    side_effects, expected = _mock_execute_with_role(
+        mock_cursor,
+        "package_role",
         [
-            (
-                mock_cursor([[json.dumps(failure_data)]], []),
-                mock.call(
-                    "call system$validate_native_app_setup('@app_pkg.app_src.stage_snowflake_cli_scratch')"
-                ),
-            ),
-            (
-                mock_cursor([("old_role",)], []),
-                mock.call("select current_role()"),
-            ),
-            (None, mock.call("use role package_role")),
             (
                 mock_cursor([], []),
                 mock.call(
-                    f"drop stage if exists app_pkg.app_src.stage_snowflake_cli_scratch"
+                    "drop stage if exists app_pkg.app_src.stage_snowflake_cli_scratch"
                 ),
             ),
-            (None, mock.call("use role old_role")),
-        ]
+        ],
+    )
+    side_effects.insert(0, mock_cursor([[json.dumps(failure_data)]], []))
+    expected.insert(
+        0,
+        mock.call(
+            "call system$validate_native_app_setup('@app_pkg.app_src.stage_snowflake_cli_scratch')"
+        ),
     )
     mock_execute.side_effect = side_effects
 
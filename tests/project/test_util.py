@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from itertools import permutations
+from itertools import combinations
 
 import pytest
 from snowflake.cli.api.project.util import (
@@ -116,41 +116,48 @@ def test_is_valid_identifier():
         assert not is_valid_identifier(id_)
 
 
-def test_is_valid_object_name():
+def _combinations_in_both_orders(identifiers, num):
+    # quoted identifiers come first in the list, so combinations() alone never puts
+    # an unquoted part before a quoted one (e.g. abc."d.e"); reversing covers that
+    for name_tuple in combinations(identifiers, num):
+        yield name_tuple
+        if num > 1:
+            yield name_tuple[::-1]
+
+
+@pytest.mark.parametrize("num", [1, 2, 3])
+def test_is_valid_object_name(num):
     valid_identifiers = VALID_QUOTED_IDENTIFIERS + VALID_UNQUOTED_IDENTIFIERS
     invalid_identifiers = INVALID_QUOTED_IDENTIFIERS + INVALID_UNQUOTED_IDENTIFIERS
 
-    # any combination of 1, 2, or 3 valid identifiers separated by a '.' is valid
-    for num in [1, 2, 3]:
-        names = [".".join(p) for p in list(permutations(valid_identifiers, num))]
-        for name in names:
-            assert is_valid_object_name(name)
-            if num > 1:
-                assert not is_valid_object_name(name, 0)
-
-    # any combination with at least one invalid identifier is invalid
-    for num in [1, 2, 3]:
-        valid_permutations = list(permutations(valid_identifiers, num - 1))
-        for invalid_identifier in invalid_identifiers:
-            for valid_perm in valid_permutations:
-                combined_set = (invalid_identifier, *valid_perm)
-                names = [".".join(p) for p in list(permutations(combined_set, num))]
-                for name in names:
-                    assert not is_valid_object_name(name)
-
-
-def test_is_valid_object_name_disallow_quoted():
+    # any combination of num valid identifiers separated by a '.' is valid
+    for name_tuple in _combinations_in_both_orders(valid_identifiers, num):
+        name = ".".join(name_tuple)
+        assert is_valid_object_name(name)
+        if num > 1:
+            assert not is_valid_object_name(name, 0)
+
+    # any combination with at least one invalid identifier is invalid, whichever
+    # position the invalid identifier is in
+    for invalid_identifier in invalid_identifiers:
+        for valid_parts in combinations(valid_identifiers, num - 1):
+            for position in range(num):
+                parts = list(valid_parts)
+                parts.insert(position, invalid_identifier)
+                assert not is_valid_object_name(".".join(parts))
+
+
+@pytest.mark.parametrize("num", [1, 2, 3])
+def test_is_valid_object_name_disallow_quoted(num):
     valid_identifiers = VALID_QUOTED_IDENTIFIERS + VALID_UNQUOTED_IDENTIFIERS
-    for num in [1, 2, 3]:
-        name_tuples = list(permutations(valid_identifiers, num))
-        for name_tuple in name_tuples:
-            has_quotes = any(t in VALID_QUOTED_IDENTIFIERS for t in name_tuple)
-            name = ".".join(name_tuple)
-            assert is_valid_object_name(name, max_depth=2, allow_quoted=True)
-            if has_quotes:
-                assert not is_valid_object_name(name, max_depth=2, allow_quoted=False)
-            else:
-                assert is_valid_object_name(name, max_depth=2, allow_quoted=False)
+    for name_tuple in _combinations_in_both_orders(valid_identifiers, num):
+        has_quotes = any(t in VALID_QUOTED_IDENTIFIERS for t in name_tuple)
+        name = ".".join(name_tuple)
+        assert is_valid_object_name(name, max_depth=2, allow_quoted=True)
+        if has_quotes:
+            assert not is_valid_object_name(name, max_depth=2, allow_quoted=False)
+        else:
+            assert is_valid_object_name(name, max_depth=2, allow_quoted=False)
 
 
 def test_to_identifier():
@@ -156,8 +156,9 @@ def test_new_local_file(mock_list, mock_cursor):
         assert diff_result.only_local == as_stage_paths(["a/new/README.md"])
 
 
+@pytest.mark.parametrize("parallel_hashing_threshold", [32, 0])
 @mock.patch(f"{STAGE_MANAGER}.list_files")
-def test_modified_file(mock_list, mock_cursor):
+def test_modified_file(mock_list, mock_cursor, parallel_hashing_threshold):
     mock_list.return_value = mock_cursor(
         rows=stage_contents(FILE_CONTENTS),
         columns=STAGE_LS_COLUMNS,
@@ -168,13 +169,14 @@ def test_modified_file(mock_list, mock_cursor):
             **FILE_CONTENTS,
             "README.md": "This is a modification to the existing README",
         }
-    ) as local_path:
+    ) as local_path, mock.patch(
+        "snowflake.cli._plugins.stage.diff._PARALLEL_HASHING_THRESHOLD",
+        parallel_hashing_threshold,
+    ):
         diff_result = compute_stage_diff(local_path, DefaultStagePathParts("a.b.stage"))
         assert len(diff_result.only_on_stage) == 0
-        assert sorted(diff_result.different) == as_stage_paths(["README.md"])
-        assert sorted(diff_result.identical) == as_stage_paths(
-            ["my.jar", "ui/streamlit.py"]
-        )
+        assert diff_result.different == as_stage_paths(["README.md"])
+        assert diff_result.identical == as_stage_paths(["my.jar", "ui/streamlit.py"])
         assert len(diff_result.only_local) == 0
 
 
@@ -11,7 +11,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import json
 import sys
+import time
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest import mock
@@ -19,6 +21,7 @@ from unittest.mock import MagicMock
 
 import pytest
 from snowflake.cli._plugins.stage.manager import StageManager
+from snowflake.cli.api.commands.common import OnErrorType
 from snowflake.cli.api.errno import DOES_NOT_EXIST_OR_NOT_AUTHORIZED
 from snowflake.cli.api.stage_path import StagePath
 from snowflake.connector import ProgrammingError
@@ -91,7 +94,7 @@ def test_stage_copy_remote_to_local(mock_execute, runner, mock_cursor):
         )
     assert result.exit_code == 0, result.output
     mock_execute.assert_called_once_with(
-        f"get @stageName file://{Path(tmp_dir).resolve()}/ parallel=4"
+        f"get @stageName file://{Path(tmp_dir).absolute()}/ parallel=4"
     )
 
 
@@ -104,7 +107,7 @@ def test_stage_copy_remote_to_local_quoted_stage(mock_execute, runner, mock_curs
         )
     assert result.exit_code == 0, result.output
     mock_execute.assert_called_once_with(
-        f"get '@\"stage name\"' file://{Path(tmp_dir).resolve()}/ parallel=4"
+        f"get '@\"stage name\"' file://{Path(tmp_dir).absolute()}/ parallel=4"
     )
 
 
@@ -132,7 +135,7 @@ def test_stage_copy_remote_to_local_quoted_stage_recursive(
     assert mock_execute.mock_calls == [
         mock.call("ls '@\"stage name\"'", cursor_class=DictCursor),
         mock.call(
-            f"get '@\"stage name\"/file' file://{Path(tmp_dir).resolve()}/ parallel=4"
+            f"get '@\"stage name\"/file' file://{Path(tmp_dir).absolute()}/ parallel=4"
         ),
     ]
 
@@ -235,7 +238,7 @@ def test_stage_copy_local_to_remote(mock_execute, runner, mock_cursor):
         )
     assert result.exit_code == 0, result.output
     mock_execute.assert_called_once_with(
-        f"put file://{Path(tmp_dir).resolve()}/* @stageName auto_compress=true parallel=42 overwrite=True",
+        f"put file://{Path(tmp_dir).absolute()}/* @stageName auto_compress=true parallel=42 overwrite=True",
         cursor_class=SnowflakeCursor,
     )
 
@@ -259,7 +262,7 @@ def test_stage_copy_local_to_remote_quoted_stage(mock_execute, runner, mock_curs
         )
     assert result.exit_code == 0, result.output
     mock_execute.assert_called_once_with(
-        f"put file://{Path(tmp_dir).resolve()}/* '@\"stage name\"' auto_compress=false parallel=42 overwrite=True",
+        f"put file://{Path(tmp_dir).absolute()}/* '@\"stage name\"' auto_compress=false parallel=42 overwrite=True",
         cursor_class=SnowflakeCursor,
     )
 
@@ -328,7 +331,7 @@ def test_stage_copy_local_to_remote_star(mock_execute, runner, mock_cursor):
         )
     assert result.exit_code == 0, result.output
     mock_execute.assert_called_once_with(
-        f"put file://{Path(tmp_dir).resolve()}/*.py @stageName auto_compress=false parallel=42 overwrite=True",
+        f"put file://{Path(tmp_dir).absolute()}/*.py @stageName auto_compress=false parallel=42 overwrite=True",
         cursor_class=SnowflakeCursor,
     )
 
@@ -552,6 +555,40 @@ def test_stage_remove(mock_execute, runner, mock_cursor):
     mock_execute.assert_called_once_with("remove @stageName/my/file/foo.csv")
 
 
+@mock.patch(f"{STAGE_MANAGER}._conn", new_callable=mock.PropertyMock)
+def test_stage_remove_multiple_files(mock_conn, runner):
+    mock_cursor = mock_conn.return_value.cursor.return_value
+    mock_cursor.description = [mock.Mock(), mock.Mock()]
+    mock_cursor.description[0].name = "name"
+    mock_cursor.description[1].name = "result"
+    mock_cursor.__iter__.side_effect = [
+        iter([("stagename/a.csv", "removed")]),
+        iter([("stagename/dir/b.csv", "removed")]),
+    ]
+    mock_cursor.nextset.side_effect = [mock_cursor, None]
+    result = runner.invoke(
+        [
+            "stage",
+            "remove",
+            "-c",
+            "empty",
+            "stageName",
+            "a.csv",
+            "dir/b.csv",
+            "--format",
+            "json",
+        ]
+    )
+    assert result.exit_code == 0, result.output
+    mock_cursor.execute.assert_called_once_with(
+        "remove @stageName/a.csv;\nremove @stageName/dir/b.csv", num_statements=2
+    )
+    assert json.loads(result.output) == [
+        {"name": "stagename/a.csv", "result": "removed"},
+        {"name": "stagename/dir/b.csv", "result": "removed"},
+    ]
+
+
 @mock.patch(f"{STAGE_MANAGER}.execute_query")
 def test_stage_remove_quoted(mock_execute, runner, mock_cursor):
     mock_execute.return_value = mock_cursor(["row"], [])
@@ -833,6 +870,92 @@ def test_execute(
     assert result.output == os_agnostic_snapshot
 
 
+def _mock_parallel_execute_query(mock_cursor, failing_file=None):
+    def _execute_query(query, **kwargs):
+        if query.startswith("ls "):
+            return mock_cursor(
+                [
+                    {"name": "exe/a/S3.sql"},
+                    {"name": "exe/a/b/s4.sql"},
+                    {"name": "exe/s1.sql"},
+                    {"name": "exe/s2"},
+                ],
+                [],
+            )
+        if query.endswith("s1.sql"):
+            # the first file finishes last
+            time.sleep(0.1)
+        if query.endswith(str(failing_file)):
+            raise ProgrammingError("Error")
+        return mock_cursor([], [])
+
+    return _execute_query
+
+
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+def test_execute_parallel(mock_execute, mock_cursor, runner):
+    mock_execute.side_effect = _mock_parallel_execute_query(mock_cursor)
+    expected_files = ["@exe/s1.sql", "@exe/a/S3.sql", "@exe/a/b/s4.sql"]
+
+    result = runner.invoke(
+        [
+            "stage",
+            "execute",
+            "@exe",
+            "--parallel",
+            "3",
+            "--on-error",
+            "continue",
+        ]
+    )
+
+    assert result.exit_code == 0, result.output
+    ls_call, *execute_calls = mock_execute.mock_calls
+    assert ls_call == mock.call("ls @exe", cursor_class=DictCursor)
+    assert sorted(execute_calls) == sorted(
+        mock.call(f"execute immediate from {f}") for f in expected_files
+    )
+    # results are reported in the same order as for sequential execution
+    status_lines = [
+        line for line in result.output.splitlines() if line.startswith("SUCCESS")
+    ]
+    assert status_lines == [f"SUCCESS - {f}" for f in expected_files]
+
+
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+def test_execute_parallel_continue_on_error(mock_execute, mock_cursor):
+    mock_execute.side_effect = _mock_parallel_execute_query(
+        mock_cursor, failing_file="@exe/s1.sql"
+    )
+
+    results = StageManager().execute(
+        stage_path_str="@exe", on_error=OnErrorType.CONTINUE, parallel=3
+    )
+
+    assert results == [
+        {"File": "@exe/s1.sql", "Status": "FAILURE", "Error": "Error"},
+        {"File": "@exe/a/S3.sql", "Status": "SUCCESS", "Error": None},
+        {"File": "@exe/a/b/s4.sql", "Status": "SUCCESS", "Error": None},
+    ]
+
+
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+def test_execute_parallel_requires_continue_on_error(mock_execute, runner):
+    result = runner.invoke(["stage", "execute", "@exe", "--parallel", "3"])
+
+    assert result.exit_code == 2, result.output
+    assert "Parallel execution requires `--on-error continue`" in result.output
+    mock_execute.assert_not_called()
+
+
+@mock.patch(f"{STAGE_MANAGER}.execute_query")
+def test_execute_parallel_must_be_positive(mock_execute, runner):
+    result = runner.invoke(["stage", "execute", "@exe", "--parallel", "0"])
+    assert result.exit_code == 2, result.output
+    assert "--parallel" in result.output
+    mock_execute.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "stage_path, expected_files",
     [
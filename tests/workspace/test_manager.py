@@ -103,8 +103,7 @@ def test_migrate_nativeapp_fields_with_username(
         result = runner.invoke(["helpers", "v1-to-v2", "--accept-templates"])
         assert result.exit_code == 0, result.output
 
-        with definition_path.open("r") as f:
-            new_definition = yaml.safe_load(f)
+        new_definition = yaml.safe_load(definition_path.read_text())
         assert (
             new_definition["entities"]["app"]["identifier"]
             == "<% fn.concat_ids('integration', '_', fn.sanitize_id(fn.get_username('unknown_user')) | lower) %>"
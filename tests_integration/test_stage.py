@@ -616,6 +616,36 @@ def test_stage_list(runner, test_database):
         assert result.json[0]["name"] == f"{stage_name}/under/directory/test.txt"
 
 
+@pytest.mark.integration
+def test_stage_remove_multiple_files(runner, snowflake_session, test_database):
+    stage_name = "test_stage"
+    result = runner.invoke_with_connection(["stage", "create", stage_name])
+    assert result.exit_code == 0, result.output
+
+    filenames = ["a.txt", "b.txt", "c.txt"]
+    with tempfile.TemporaryDirectory() as td:
+        for filename in filenames:
+            (Path(td) / filename).touch()
+        result = runner.invoke_with_connection_json(
+            ["stage", "copy", f"{td}/*.txt", f"@{stage_name}/dir/"]
+        )
+        assert result.exit_code == 0, result.output
+
+    result = runner.invoke_with_connection_json(
+        ["stage", "remove", stage_name, "dir/a.txt", "dir/c.txt"]
+    )
+    assert result.exit_code == 0, result.output
+    assert result.json == [
+        {"name": f"{stage_name}/dir/a.txt", "result": "removed"},
+        {"name": f"{stage_name}/dir/c.txt", "result": "removed"},
+    ]
+
+    expect = snowflake_session.execute_string(f"list @{stage_name}")
+    assert [row["name"] for row in row_from_snowflake_session(expect)] == [
+        f"{stage_name}/dir/b.txt"
+    ]
+
+
 @pytest.mark.integration
 @pytest.mark.parametrize("pattern", ["", "**/*", "**"])
 def test_recursive_upload(temp_dir, pattern, runner, test_database):